@@ -9,6 +9,17 @@ from evalml.pipelines.utils import _make_stacked_ensemble_pipeline
 from evalml.problem_types import is_multiclass
 from evalml.tuners import SKOptTuner
 
+_INIT_PARAMETERS_CACHE = {}
+
+
+def _get_init_parameters(component_class):
+    """Returns the names of the arguments accepted by a component's __init__, caching the result per class."""
+    init_params = _INIT_PARAMETERS_CACHE.get(component_class)
+    if init_params is None:
+        init_params = frozenset(inspect.signature(component_class.__init__).parameters)
+        _INIT_PARAMETERS_CACHE[component_class] = init_params
+    return init_params
+
 
 class AutoMLAlgorithmException(Exception):
     """Exception raised when an error is encountered during the computation of the automl algorithm."""
@@ -111,7 +122,7 @@ class AutoMLAlgorithm(ABC):
         ) in pipeline.component_graph.component_instances.items():
             component_class = type(component_instance)
             component_parameters = proposed_parameters.get(name, {})
-            init_params = inspect.signature(component_class.__init__).parameters
+            init_params = _get_init_parameters(component_class)
             # Only overwrite the parameters that were passed in on pipeline parameters
             # if they don't exist in the propsed parameters
             if name in self._pipeline_parameters and name not in component_parameters:
@@ -166,17 +177,16 @@ class AutoMLAlgorithm(ABC):
 
     def _create_ensemble(self, label_encoder_params=None):
         next_batch = []
-        best_pipelines = list(self._best_pipeline_info.values())
-        problem_type = best_pipelines[0]["pipeline"].problem_type
+        input_pipelines = [
+            pipeline_dict["pipeline"]
+            for pipeline_dict in self._best_pipeline_info.values()
+        ]
+        problem_type = input_pipelines[0].problem_type
         n_jobs_ensemble = 1 if self.text_in_ensembling else self.n_jobs
-        input_pipelines = []
         cached_data = {
             model_family: x["cached_data"]
             for model_family, x in self._best_pipeline_info.items()
         }
-        for pipeline_dict in best_pipelines:
-            pipeline = pipeline_dict["pipeline"]
-            input_pipelines.append(pipeline)
 
         if label_encoder_params is not None:
             label_encoder_params = {"Label Encoder": label_encoder_params}
@@ -1,7 +1,8 @@
 """An automl algorithm that consists of two modes: fast and long, where fast is a subset of long."""
+import heapq
 import logging
-
-import numpy as np
+from math import inf
+from operator import itemgetter
 
 from .automl_algorithm import AutoMLAlgorithm
 
@@ -119,6 +120,7 @@ class DefaultAlgorithm(AutoMLAlgorithm):
         self.allow_long_running_models = allow_long_running_models
         self._X_with_cat_cols = None
         self._X_without_cat_cols = None
+        self._pipeline_templates = {}
         self.features = features
         self.ensembling = ensembling
 
@@ -139,27 +141,44 @@ class DefaultAlgorithm(AutoMLAlgorithm):
 
         self._set_additional_pipeline_params()
         self._separate_hyperparameters_from_parameters()
+        self._naive_estimator_classes = None
+        self._naive_estimator_set = None
+        self._all_estimator_classes = None
 
     @property
     def default_max_batches(self):
         """Returns the number of max batches AutoMLSearch should run by default."""
         return 4 if self.ensembling else 3
 
+    def _get_naive_estimator_classes(self):
+        if self._naive_estimator_classes is None:
+            if is_regression(self.problem_type):
+                naive_estimators = [
+                    "Elastic Net Regressor",
+                    "Random Forest Regressor",
+                ]
+            else:
+                naive_estimators = [
+                    "Logistic Regression Classifier",
+                    "Random Forest Classifier",
+                ]
+            self._naive_estimator_classes = tuple(
+                handle_component_class(estimator) for estimator in naive_estimators
+            )
+        return self._naive_estimator_classes
+
+    def _get_naive_estimator_set(self):
+        if self._naive_estimator_set is None:
+            self._naive_estimator_set = frozenset(self._get_naive_estimator_classes())
+        return self._naive_estimator_set
+
     def _naive_estimators(self):
-        if is_regression(self.problem_type):
-            naive_estimators = [
-                "Elastic Net Regressor",
-                "Random Forest Regressor",
-            ]
-        else:
-            naive_estimators = [
-                "Logistic Regression Classifier",
-                "Random Forest Classifier",
-            ]
-        estimators = [
-            handle_component_class(estimator) for estimator in naive_estimators
-        ]
-        return estimators
+        return list(self._get_naive_estimator_classes())
+
+    def _get_all_estimator_classes(self):
+        if self._all_estimator_classes is None:
+            self._all_estimator_classes = tuple(get_estimators(self.problem_type))
+        return self._all_estimator_classes
 
     def _init_pipelines_with_starter_params(self, pipelines):
         next_batch = []
@@ -267,10 +286,11 @@ class DefaultAlgorithm(AutoMLAlgorithm):
         self._separate_hyperparameters_from_parameters()
 
     def _create_fast_final(self):
+        naive_estimators = self._get_naive_estimator_set()
         estimators = [
             estimator
-            for estimator in get_estimators(self.problem_type)
-            if estimator not in self._naive_estimators()
+            for estimator in self._get_all_estimator_classes()
+            if estimator not in naive_estimators
         ]
         estimators = self._filter_estimators(
             estimators,
@@ -292,18 +312,19 @@ class DefaultAlgorithm(AutoMLAlgorithm):
 
     def _create_n_pipelines(self, pipelines, n, create_starting_parameters=False):
         next_batch = []
+        select_parameters = self._create_select_parameters()
+        for pipeline in pipelines:
+            if pipeline.name not in self._tuners:
+                self._create_tuner(pipeline)
+        tuners = [self._tuners[pipeline.name] for pipeline in pipelines]
         for _ in range(n):
-            for pipeline in pipelines:
-                if pipeline.name not in self._tuners:
-                    self._create_tuner(pipeline)
-
-                select_parameters = self._create_select_parameters()
+            for pipeline, tuner in zip(pipelines, tuners):
                 parameters = (
-                    self._tuners[pipeline.name].get_starting_parameters(
+                    tuner.get_starting_parameters(
                         self._hyperparameters, self.random_seed
                     )
                     if create_starting_parameters
-                    else self._tuners[pipeline.name].propose()
+                    else tuner.propose()
                 )
                 parameters = self._transform_parameters(pipeline, parameters)
                 parameters.update(select_parameters)
@@ -313,81 +334,67 @@ class DefaultAlgorithm(AutoMLAlgorithm):
         return next_batch
 
     def _create_long_exploration(self, n):
+        best_pipelines = heapq.nsmallest(
+            n,
+            self._best_pipeline_info.values(),
+            key=itemgetter("mean_cv_score"),
+        )
         estimators = [
-            (pipeline_dict["pipeline"].estimator, pipeline_dict["mean_cv_score"])
-            for pipeline_dict in self._best_pipeline_info.values()
+            pipeline_dict["pipeline"].estimator.__class__
+            for pipeline_dict in best_pipelines
         ]
-        estimators.sort(key=lambda x: x[1])
-        estimators = estimators[:n]
-        estimators = [estimator[0].__class__ for estimator in estimators]
         pipelines = self._make_pipelines_helper(estimators)
         self._top_n_pipelines = pipelines
         return self._create_n_pipelines(pipelines, self.num_long_explore_pipelines)
 
     def _make_pipelines_helper(self, estimators):
         pipelines = []
-        if is_time_series(self.problem_type):
-            pipelines = [
-                make_pipeline(
-                    X=self.X,
-                    y=self.y,
-                    estimator=estimator,
-                    problem_type=self.problem_type,
-                    sampler_name=self.sampler_name,
-                    parameters=self._pipeline_parameters,
-                    known_in_advance=self.search_parameters.get("pipeline", {}).get(
-                        "known_in_advance", None
-                    ),
-                    features=self.features,
-                )
-                for estimator in estimators
-            ]
-        else:
-            pipelines = [
-                self._make_split_pipeline(estimator) for estimator in estimators
-            ]
+        for estimator in estimators:
+            pipeline = self._pipeline_templates.get(estimator)
+            if pipeline is None:
+                pipeline = self._make_pipeline_template(estimator)
+                self._pipeline_templates[estimator] = pipeline
+            pipelines.append(pipeline)
         return pipelines
 
+    def _make_pipeline_template(self, estimator):
+        if is_time_series(self.problem_type):
+            return make_pipeline(
+                X=self.X,
+                y=self.y,
+                estimator=estimator,
+                problem_type=self.problem_type,
+                sampler_name=self.sampler_name,
+                parameters=self._pipeline_parameters,
+                known_in_advance=self.search_parameters.get("pipeline", {}).get(
+                    "known_in_advance", None
+                ),
+                features=self.features,
+            )
+        return self._make_split_pipeline(estimator)
+
     def next_batch(self):
         """Get the next batch of pipelines to evaluate.
 
         Returns:
             list(PipelineBase): a list of instances of PipelineBase subclasses, ready to be trained and evaluated.
         """
-        if self.ensembling:
-            if self._batch_number == 0:
-                next_batch = self._create_naive_pipelines()
-            elif self._batch_number == 1:
-                next_batch = self._create_naive_pipelines(use_features=True)
-            elif self._batch_number == 2:
-                next_batch = self._create_fast_final()
-            elif self.batch_number == 3:
-                next_batch = self._create_ensemble(
-                    self._pipeline_parameters.get("Label Encoder", {})
-                )
-            elif self.batch_number == 4:
-                next_batch = self._create_long_exploration(n=self.top_n)
-            elif self.batch_number % 2 != 0:
-                next_batch = self._create_ensemble(
-                    self._pipeline_parameters.get("Label Encoder", {})
-                )
-            else:
-                next_batch = self._create_n_pipelines(
-                    self._top_n_pipelines, self.num_long_pipelines_per_batch
-                )
+        if self._batch_number == 0:
+            next_batch = self._create_naive_pipelines()
+        elif self._batch_number == 1:
+            next_batch = self._create_naive_pipelines(use_features=True)
+        elif self._batch_number == 2:
+            next_batch = self._create_fast_final()
+        elif self._batch_number == (4 if self.ensembling else 3):
+            next_batch = self._create_long_exploration(n=self.top_n)
+        elif self.ensembling and self._batch_number % 2 != 0:
+            next_batch = self._create_ensemble(
+                self._pipeline_parameters.get("Label Encoder", {})
+            )
         else:
-            if self._batch_number == 0:
-                next_batch = self._create_naive_pipelines()
-            elif self._batch_number == 1:
-                next_batch = self._create_naive_pipelines(use_features=True)
-            elif self._batch_number == 2:
-                next_batch = self._create_fast_final()
-            elif self.batch_number == 3:
-                next_batch = self._create_long_exploration(n=self.top_n)
-            else:
-                next_batch = self._create_n_pipelines(
-                    self._top_n_pipelines, self.num_long_pipelines_per_batch
-                )
+            next_batch = self._create_n_pipelines(
+                self._top_n_pipelines, self.num_long_pipelines_per_batch
+            )
 
         self._pipeline_number += len(next_batch)
         self._batch_number += 1
@@ -444,7 +451,7 @@ class DefaultAlgorithm(AutoMLAlgorithm):
                 Defaults to None.
         """
         cached_data = cached_data or {}
-        if pipeline.model_family != ModelFamily.ENSEMBLE:
+        if pipeline.model_family is not ModelFamily.ENSEMBLE:
             if self.batch_number >= 3:
                 super().add_result(
                     score_to_minimize, pipeline, trained_pipeline_results
@@ -466,13 +473,15 @@ class DefaultAlgorithm(AutoMLAlgorithm):
 
             self._parse_selected_categorical_features(pipeline)
 
-        current_best_score = self._best_pipeline_info.get(
-            pipeline.model_family, {}
-        ).get("mean_cv_score", np.inf)
+        if score_to_minimize is None:
+            return
+        current_best = self._best_pipeline_info.get(pipeline.model_family)
+        current_best_score = (
+            current_best["mean_cv_score"] if current_best is not None else inf
+        )
         if (
-            score_to_minimize is not None
-            and score_to_minimize < current_best_score
-            and pipeline.model_family != ModelFamily.ENSEMBLE
+            score_to_minimize < current_best_score
+            and pipeline.model_family is not ModelFamily.ENSEMBLE
         ):
             self._best_pipeline_info.update(
                 {
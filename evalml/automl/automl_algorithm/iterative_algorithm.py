@@ -1,10 +1,9 @@
 """An automl algorithm which first fits a base round of pipelines with default parameters, then does a round of parameter tuning on each pipeline in order of performance."""
 import logging
 import warnings
+from math import inf
 from operator import itemgetter
 
-import numpy as np
-
 from .automl_algorithm import AutoMLAlgorithm, AutoMLAlgorithmException
 
 from evalml.automl.utils import get_pipelines_from_component_graphs
@@ -338,7 +337,7 @@ class IterativeAlgorithm(AutoMLAlgorithm):
             ValueError: If default parameters are not in the acceptable hyperparameter ranges.
         """
         cached_data = cached_data or {}
-        if pipeline.model_family != ModelFamily.ENSEMBLE:
+        if pipeline.model_family is not ModelFamily.ENSEMBLE:
             if self.batch_number == 1:
                 try:
                     super().add_result(
@@ -359,13 +358,15 @@ class IterativeAlgorithm(AutoMLAlgorithm):
                 )
         if self.batch_number == 1:
             self._first_batch_results.append((score_to_minimize, pipeline))
-        current_best_score = self._best_pipeline_info.get(
-            pipeline.model_family, {}
-        ).get("mean_cv_score", np.inf)
+        if score_to_minimize is None:
+            return
+        current_best = self._best_pipeline_info.get(pipeline.model_family)
+        current_best_score = (
+            current_best["mean_cv_score"] if current_best is not None else inf
+        )
         if (
-            score_to_minimize is not None
-            and score_to_minimize < current_best_score
-            and pipeline.model_family != ModelFamily.ENSEMBLE
+            score_to_minimize < current_best_score
+            and pipeline.model_family is not ModelFamily.ENSEMBLE
         ):
             self._best_pipeline_info.update(
                 {
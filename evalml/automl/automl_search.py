@@ -1176,7 +1176,7 @@ class AutoMLSearch:
         training_time = evaluation_results["training_time"]
         cv_data = evaluation_results["cv_data"]
         cv_scores = evaluation_results["cv_scores"]
-        is_baseline = pipeline.model_family == ModelFamily.BASELINE
+        is_baseline = pipeline.model_family is ModelFamily.BASELINE
         if len(cv_scores) == 1:
             validation_score = cv_scores[0]
             mean_cv_score = np.nan
@@ -1223,7 +1223,7 @@ class AutoMLSearch:
         }
         self._pipelines_searched.update({pipeline_id: pipeline.clone()})
 
-        if pipeline.model_family == ModelFamily.ENSEMBLE:
+        if pipeline.model_family is ModelFamily.ENSEMBLE:
             input_pipeline_ids = [
                 self.automl_algorithm._best_pipeline_info[model_family]["id"]
                 for model_family in self.automl_algorithm._best_pipeline_info
@@ -1328,7 +1328,7 @@ class AutoMLSearch:
 
         pipeline.describe()
 
-        if pipeline.model_family == ModelFamily.ENSEMBLE:
+        if pipeline.model_family is ModelFamily.ENSEMBLE:
             logger.info(
                 "Input for ensembler are pipelines with IDs: "
                 + str(pipeline_results["input_pipeline_ids"])
@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import featuretools as ft
 import numpy as np
@@ -12,9 +12,11 @@ from evalml.pipelines.components import (
     ARIMARegressor,
     ElasticNetClassifier,
     ElasticNetRegressor,
+    ExtraTreesClassifier,
     LogisticRegressionClassifier,
     ProphetRegressor,
     RandomForestClassifier,
+    RandomForestRegressor,
     StackedEnsembleClassifier,
     StackedEnsembleRegressor,
 )
@@ -70,6 +72,32 @@ def test_default_algorithm_search_parameters_error(X_y_binary):
         )
 
 
+@pytest.mark.parametrize(
+    "problem_type, expected_estimators",
+    [
+        (
+            ProblemTypes.BINARY,
+            [LogisticRegressionClassifier, RandomForestClassifier],
+        ),
+        (
+            ProblemTypes.MULTICLASS,
+            [LogisticRegressionClassifier, RandomForestClassifier],
+        ),
+        (ProblemTypes.REGRESSION, [ElasticNetRegressor, RandomForestRegressor]),
+    ],
+)
+def test_default_algorithm_naive_estimators(
+    problem_type, expected_estimators, X_y_binary
+):
+    X, y = X_y_binary
+    algo = DefaultAlgorithm(X, y, problem_type, sampler_name=None)
+
+    assert algo._naive_estimators() == expected_estimators
+    naive_estimators = algo._naive_estimators()
+    naive_estimators.pop()
+    assert algo._naive_estimators() == expected_estimators
+
+
 def add_result(algo, batch):
     scores = np.arange(0, len(batch))
     for score, pipeline in zip(scores, batch):
@@ -827,6 +855,56 @@ def test_default_algorithm_add_result_cache(X_y_binary):
         assert values["cached_data"] == cache
 
 
+@patch(
+    "evalml.automl.automl_algorithm.default_algorithm.DefaultAlgorithm._create_n_pipelines"
+)
+@patch(
+    "evalml.automl.automl_algorithm.default_algorithm.DefaultAlgorithm._make_pipelines_helper"
+)
+def test_default_algorithm_long_exploration_top_n(
+    mock_make_pipelines, mock_create_n_pipelines, X_y_binary
+):
+    X, y = X_y_binary
+    algo = DefaultAlgorithm(X=X, y=y, problem_type="binary", sampler_name=None)
+
+    estimators = [
+        LogisticRegressionClassifier(),
+        RandomForestClassifier(),
+        ExtraTreesClassifier(),
+    ]
+    scores = [0.3, 0.1, 0.2]
+    algo._best_pipeline_info = {
+        estimator.model_family: {
+            "mean_cv_score": score,
+            "pipeline": MagicMock(estimator=estimator),
+        }
+        for estimator, score in zip(estimators, scores)
+    }
+
+    algo._create_long_exploration(n=2)
+    mock_make_pipelines.assert_called_once_with(
+        [RandomForestClassifier, ExtraTreesClassifier]
+    )
+
+
+def test_default_algorithm_make_pipelines_helper_reuses_templates(X_y_binary):
+    X, y = X_y_binary
+    algo = DefaultAlgorithm(X=X, y=y, problem_type="binary", sampler_name=None)
+
+    estimators = [ElasticNetClassifier, ExtraTreesClassifier]
+    with patch.object(
+        algo, "_make_split_pipeline", wraps=algo._make_split_pipeline
+    ) as mock_make_split_pipeline:
+        first_pipelines = algo._make_pipelines_helper(estimators)
+        assert mock_make_split_pipeline.call_count == 2
+        second_pipelines = algo._make_pipelines_helper(estimators[::-1])
+        assert mock_make_split_pipeline.call_count == 2
+
+    assert [p.estimator.__class__ for p in first_pipelines] == estimators
+    assert second_pipelines == first_pipelines[::-1]
+    assert all(a is b for a, b in zip(second_pipelines, first_pipelines[::-1]))
+
+
 def test_default_algorithm_ensembling_off(X_y_binary):
     X, y = X_y_binary
     algo = DefaultAlgorithm(
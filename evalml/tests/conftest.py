@@ -1,11 +1,13 @@
 import contextlib
 import os
+import shutil
 import sys
-from unittest.mock import PropertyMock, patch
+from functools import lru_cache
+from operator import attrgetter
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
-import py
 import pytest
 import woodwork as ww
 from sklearn import datasets
@@ -45,6 +47,12 @@ from evalml.problem_types import (
 from evalml.utils import infer_feature_types
 
 
+@lru_cache(maxsize=1)
+def _cached_all_estimators():
+    """Importable estimator classes. Finding them instantiates every estimator, so only do it once per session."""
+    return tuple(_all_estimators())
+
+
 def pytest_configure(config):
     config.addinivalue_line(
         "markers",
@@ -98,90 +106,94 @@ def graphviz():
     return graphviz
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_test_data_from_configuration():
+    X_all = pd.DataFrame(
+        {
+            "all_null": [np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan] * 2,
+            "int_null": [0, 1, 2, np.nan, 4, np.nan, 6] * 2,
+            "age_null": [0, 1, 2, np.nan, 4, np.nan, 6] * 2,
+            "bool_null": [True, None, False, True, False, None, True] * 2,
+            "numerical": range(14),
+            "categorical": ["a", "b", "a", "b", "b", "a", "b"] * 2,
+            "dates": pd.date_range("2000-02-03", periods=14, freq="W"),
+            "text": [
+                "this is a string",
+                "this is another string",
+                "this is just another string",
+                "evalml should handle string input",
+                "cats are gr8",
+                "hello world",
+                "evalml is gr8",
+            ]
+            * 2,
+            "email": [
+                "abalone_0@gmail.com",
+                "AbaloneRings@yahoo.com",
+                "abalone_2@abalone.com",
+                "titanic_data@hotmail.com",
+                "fooEMAIL@email.org",
+                "evalml@evalml.org",
+                "evalml@alteryx.org",
+            ]
+            * 2,
+            "url": [
+                "https://evalml.alteryx.com/en/stable/",
+                "https://woodwork.alteryx.com/en/stable/guides/statistical_insights.html",
+                "https://twitter.com/AlteryxOSS",
+                "https://www.twitter.com/AlteryxOSS",
+                "https://www.evalml.alteryx.com/en/stable/demos/text_input.html",
+                "https://github.com/alteryx/evalml",
+                "https://github.com/alteryx/featuretools",
+            ]
+            * 2,
+            "ip": [
+                "0.0.0.0",
+                "1.1.1.101",
+                "1.1.101.1",
+                "1.101.1.1",
+                "101.1.1.1",
+                "192.168.1.1",
+                "255.255.255.255",
+            ]
+            * 2,
+        }
+    )
+    y_binary = pd.Series([0, 0, 1, 0, 0, 1, 1] * 2)
+    y_multiclass = pd.Series([0, 2, 1, 2, 0, 2, 1] * 2)
+    y_regression = pd.Series([1, 2, 3, 3, 3, 4, 5] * 2)
+    column_logical_types = {
+        "text": "NaturalLanguage",
+        "categorical": "Categorical",
+        "url": "URL",
+        "email": "EmailAddress",
+        "int_null": "integer_nullable",
+        "age_null": "age_nullable",
+        "bool_null": "boolean_nullable",
+    }
+
     def _get_test_data_from_configuration(
         input_type, problem_type, column_names=None, nullable_target=False
     ):
-        X_all = pd.DataFrame(
-            {
-                "all_null": [np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan]
-                * 2,
-                "int_null": [0, 1, 2, np.nan, 4, np.nan, 6] * 2,
-                "age_null": [0, 1, 2, np.nan, 4, np.nan, 6] * 2,
-                "bool_null": [True, None, False, True, False, None, True] * 2,
-                "numerical": range(14),
-                "categorical": ["a", "b", "a", "b", "b", "a", "b"] * 2,
-                "dates": pd.date_range("2000-02-03", periods=14, freq="W"),
-                "text": [
-                    "this is a string",
-                    "this is another string",
-                    "this is just another string",
-                    "evalml should handle string input",
-                    "cats are gr8",
-                    "hello world",
-                    "evalml is gr8",
-                ]
-                * 2,
-                "email": [
-                    "abalone_0@gmail.com",
-                    "AbaloneRings@yahoo.com",
-                    "abalone_2@abalone.com",
-                    "titanic_data@hotmail.com",
-                    "fooEMAIL@email.org",
-                    "evalml@evalml.org",
-                    "evalml@alteryx.org",
-                ]
-                * 2,
-                "url": [
-                    "https://evalml.alteryx.com/en/stable/",
-                    "https://woodwork.alteryx.com/en/stable/guides/statistical_insights.html",
-                    "https://twitter.com/AlteryxOSS",
-                    "https://www.twitter.com/AlteryxOSS",
-                    "https://www.evalml.alteryx.com/en/stable/demos/text_input.html",
-                    "https://github.com/alteryx/evalml",
-                    "https://github.com/alteryx/featuretools",
-                ]
-                * 2,
-                "ip": [
-                    "0.0.0.0",
-                    "1.1.1.101",
-                    "1.1.101.1",
-                    "1.101.1.1",
-                    "101.1.1.1",
-                    "192.168.1.1",
-                    "255.255.255.255",
-                ]
-                * 2,
-            }
-        )
-        y = pd.Series([0, 0, 1, 0, 0, 1, 1] * 2)
+        y = y_binary
         if problem_type == ProblemTypes.MULTICLASS:
-            y = pd.Series([0, 2, 1, 2, 0, 2, 1] * 2)
+            y = y_multiclass
         elif is_regression(problem_type):
-            y = pd.Series([1, 2, 3, 3, 3, 4, 5] * 2)
+            y = y_regression
+        y = y.copy()
         if nullable_target:
             y.iloc[2] = None
             if input_type == "ww":
                 y = ww.init_series(y, logical_type="integer_nullable")
-        X = X_all[column_names]
+        X = X_all[column_names].copy()
 
         if input_type == "ww":
-            logical_types = {}
-            if "text" in column_names:
-                logical_types.update({"text": "NaturalLanguage"})
-            if "categorical" in column_names:
-                logical_types.update({"categorical": "Categorical"})
-            if "url" in column_names:
-                logical_types.update({"url": "URL"})
-            if "email" in column_names:
-                logical_types.update({"email": "EmailAddress"})
-            if "int_null" in column_names:
-                logical_types.update({"int_null": "integer_nullable"})
-            if "age_null" in column_names:
-                logical_types.update({"age_null": "age_nullable"})
-            if "bool_null" in column_names:
-                logical_types.update({"bool_null": "boolean_nullable"})
+            selected_columns = set(column_names)
+            logical_types = {
+                column: logical_type
+                for column, logical_type in column_logical_types.items()
+                if column in selected_columns
+            }
 
             X.ww.init(logical_types=logical_types)
 
@@ -192,7 +204,7 @@ def get_test_data_from_configuration():
     return _get_test_data_from_configuration
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_ts_X_y():
     def _get_X_y(
         train_features_index_dt,
@@ -202,29 +214,29 @@ def get_ts_X_y():
         no_features,
         test_features_index_dt,
     ):
-        X = pd.DataFrame(index=[i + 1 for i in range(50)])
+        index = pd.Index([i + 1 for i in range(50)])
         dates = pd.date_range("1/1/21", periods=50)
-        feature = pd.Series([1, 5, 2] * 10 + [3, 1] * 10, index=X.index)
+        feature = np.array([1, 5, 2] * 10 + [3, 1] * 10)
         y = pd.Series([1, 2, 3, 4, 5, 6, 5, 4, 3, 2] * 5)
-        X.ww.init()
-        y = ww.init_series(y)
 
-        X_train = X.ww.iloc[:40]
-        X_test = X.ww.iloc[40:]
-        y_train = y.ww.iloc[:40]
-
-        if train_features_index_dt:
-            X_train.index = dates[:40]
+        X_train = pd.DataFrame(
+            index=dates[:40] if train_features_index_dt else index[:40]
+        )
+        X_test = pd.DataFrame(
+            index=dates[40:] if test_features_index_dt else index[40:]
+        )
+        y_train = y.iloc[:40]
         if train_target_index_dt:
             y_train.index = dates[:40]
-        if test_features_index_dt:
-            X_test.index = dates[40:]
         if not no_features:
-            X_train.ww["Feature"] = pd.Series(feature[:40].values, index=X_train.index)
-            X_test.ww["Feature"] = pd.Series(feature[40:].values, index=X_test.index)
+            X_train["Feature"] = feature[:40]
+            X_test["Feature"] = feature[40:]
             if datetime_feature:
-                X_train.ww["Dates"] = pd.Series(dates[:40].values, index=X_train.index)
-                X_test.ww["Dates"] = pd.Series(dates[40:].values, index=X_test.index)
+                X_train["Dates"] = dates[:40]
+                X_test["Dates"] = dates[40:]
+        X_train.ww.init()
+        X_test.ww.init()
+        y_train = ww.init_series(y_train)
         if train_none:
             X_train = None
 
@@ -233,19 +245,31 @@ def get_ts_X_y():
     return _get_X_y
 
 
+_MOCK_PIPELINE_CLASSES = {
+    ProblemTypes.BINARY: BinaryClassificationPipeline,
+    ProblemTypes.MULTICLASS: MulticlassClassificationPipeline,
+    ProblemTypes.REGRESSION: RegressionPipeline,
+    ProblemTypes.TIME_SERIES_REGRESSION: TimeSeriesRegressionPipeline,
+    ProblemTypes.TIME_SERIES_BINARY: TimeSeriesBinaryClassificationPipeline,
+    ProblemTypes.TIME_SERIES_MULTICLASS: TimeSeriesMulticlassClassificationPipeline,
+}
+_MOCK_PIPELINE_NO_N_JOBS_FAMILIES = frozenset(
+    {
+        ModelFamily.SVM,
+        ModelFamily.DECISION_TREE,
+        ModelFamily.VOWPAL_WABBIT,
+        ModelFamily.PROPHET,
+    }
+)
+
+
 def create_mock_pipeline(
     estimator, problem_type, parameters=None, add_label_encoder=False
 ):
     pipeline_parameters = (
         {estimator.name: {"n_jobs": 1}}
         if (
-            estimator.model_family
-            not in [
-                ModelFamily.SVM,
-                ModelFamily.DECISION_TREE,
-                ModelFamily.VOWPAL_WABBIT,
-                ModelFamily.PROPHET,
-            ]
+            estimator.model_family not in _MOCK_PIPELINE_NO_N_JOBS_FAMILIES
             and "Elastic Net" not in estimator.name
         )
         else {}
@@ -272,34 +296,17 @@ def create_mock_pipeline(
         }
     )
 
-    if problem_type == ProblemTypes.BINARY:
-        return BinaryClassificationPipeline(
-            component_graph, parameters=pipeline_parameters, custom_name=custom_name
-        )
-    elif problem_type == ProblemTypes.MULTICLASS:
-        return MulticlassClassificationPipeline(
-            component_graph, parameters=pipeline_parameters, custom_name=custom_name
-        )
-    elif problem_type == ProblemTypes.REGRESSION:
-        return RegressionPipeline(
-            component_graph, parameters=pipeline_parameters, custom_name=custom_name
-        )
-    elif problem_type == ProblemTypes.TIME_SERIES_REGRESSION:
-        return TimeSeriesRegressionPipeline(
-            component_graph, parameters=pipeline_parameters, custom_name=custom_name
-        )
-    elif problem_type == ProblemTypes.TIME_SERIES_BINARY:
-        return TimeSeriesBinaryClassificationPipeline(
-            component_graph, parameters=pipeline_parameters, custom_name=custom_name
-        )
-    elif problem_type == ProblemTypes.TIME_SERIES_MULTICLASS:
-        return TimeSeriesMulticlassClassificationPipeline(
-            component_graph, parameters=pipeline_parameters, custom_name=custom_name
-        )
+    pipeline_class = _MOCK_PIPELINE_CLASSES[problem_type]
+    pipeline = pipeline_class(
+        component_graph, parameters=pipeline_parameters, custom_name=custom_name
+    )
+    pipeline._has_label_encoder = add_label_encoder
+    return pipeline
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def all_pipeline_classes():
+    """Mock pipelines for every estimator and problem type, shared across the session. Clone before fitting."""
     ts_parameters = {
         "pipeline": {
             "time_index": "date",
@@ -310,7 +317,7 @@ def all_pipeline_classes():
     }
 
     all_possible_pipeline_classes = []
-    for estimator in _all_estimators():
+    for estimator in _cached_all_estimators():
         for problem_type in estimator.supported_problem_types:
 
             all_possible_pipeline_classes.append(
@@ -329,46 +336,62 @@ def all_pipeline_classes():
                     add_label_encoder=True,
                 )
             )
-    return all_possible_pipeline_classes
+    return tuple(all_possible_pipeline_classes)
+
+
+@pytest.fixture(scope="session")
+def all_pipeline_classes_by_type(all_pipeline_classes):
+    pipeline_classes = [BinaryClassificationPipeline, MulticlassClassificationPipeline]
+    pipelines_by_type = {
+        (pipeline_class, has_label_encoder): []
+        for pipeline_class in pipeline_classes
+        for has_label_encoder in [False, True]
+    }
+    for pipeline in all_pipeline_classes:
+        for pipeline_class in pipeline_classes:
+            if isinstance(pipeline, pipeline_class):
+                key = (pipeline_class, pipeline._has_label_encoder)
+                pipelines_by_type[key].append(pipeline)
+    return pipelines_by_type
 
 
 @pytest.fixture
-def all_binary_pipeline_classes(all_pipeline_classes):
+def all_binary_pipeline_classes(all_pipeline_classes_by_type):
     return [
-        pipeline
-        for pipeline in all_pipeline_classes
-        if isinstance(pipeline, BinaryClassificationPipeline)
-        and "label encoder" not in pipeline.custom_name
+        pipeline.clone()
+        for pipeline in all_pipeline_classes_by_type[
+            (BinaryClassificationPipeline, False)
+        ]
     ]
 
 
 @pytest.fixture
-def all_binary_pipeline_classes_with_encoder(all_pipeline_classes):
+def all_binary_pipeline_classes_with_encoder(all_pipeline_classes_by_type):
     return [
-        pipeline
-        for pipeline in all_pipeline_classes
-        if isinstance(pipeline, BinaryClassificationPipeline)
-        and "label encoder" in pipeline.custom_name
+        pipeline.clone()
+        for pipeline in all_pipeline_classes_by_type[
+            (BinaryClassificationPipeline, True)
+        ]
     ]
 
 
 @pytest.fixture
-def all_multiclass_pipeline_classes(all_pipeline_classes):
+def all_multiclass_pipeline_classes(all_pipeline_classes_by_type):
     return [
-        pipeline
-        for pipeline in all_pipeline_classes
-        if isinstance(pipeline, MulticlassClassificationPipeline)
-        and "label encoder" not in pipeline.custom_name
+        pipeline.clone()
+        for pipeline in all_pipeline_classes_by_type[
+            (MulticlassClassificationPipeline, False)
+        ]
     ]
 
 
 @pytest.fixture
-def all_multiclass_pipeline_classes_with_encoder(all_pipeline_classes):
+def all_multiclass_pipeline_classes_with_encoder(all_pipeline_classes_by_type):
     return [
-        pipeline
-        for pipeline in all_pipeline_classes
-        if isinstance(pipeline, MulticlassClassificationPipeline)
-        and "label encoder" in pipeline.custom_name
+        pipeline.clone()
+        for pipeline in all_pipeline_classes_by_type[
+            (MulticlassClassificationPipeline, True)
+        ]
     ]
 
 
@@ -389,22 +412,27 @@ def pytest_addoption(parser):
     )
 
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config, items):
+    skip_markers = {}
     if config.getoption("--has-minimal-dependencies"):
-        skip_noncore = pytest.mark.skip(reason="needs noncore dependency")
-        for item in items:
-            if "noncore_dependency" in item.keywords:
-                item.add_marker(skip_noncore)
+        skip_markers["noncore_dependency"] = pytest.mark.skip(
+            reason="needs noncore dependency"
+        )
     if config.getoption("--is-using-conda"):
-        skip_conda = pytest.mark.skip(reason="Test does not run during conda")
-        for item in items:
-            if "skip_during_conda" in item.keywords:
-                item.add_marker(skip_conda)
+        skip_markers["skip_during_conda"] = pytest.mark.skip(
+            reason="Test does not run during conda"
+        )
     if sys.version_info >= (3, 9):
-        skip_39 = pytest.mark.skip(reason="Test dependency not supported in python 3.9")
-        for item in items:
-            if "skip_if_39" in item.keywords:
-                item.add_marker(skip_39)
+        skip_markers["skip_if_39"] = pytest.mark.skip(
+            reason="Test dependency not supported in python 3.9"
+        )
+    if not skip_markers:
+        return
+    for item in items:
+        for keyword, skip_marker in skip_markers.items():
+            if keyword in item.keywords:
+                item.add_marker(skip_marker)
 
 
 @pytest.fixture
@@ -432,19 +460,16 @@ def assert_allowed_pipelines_equal_helper():
     def assert_allowed_pipelines_equal_helper(
         actual_allowed_pipelines, expected_allowed_pipelines
     ):
-        actual_allowed_pipelines.sort(key=lambda p: p.name)
-        expected_allowed_pipelines.sort(key=lambda p: p.name)
+        actual_allowed_pipelines = sorted(
+            actual_allowed_pipelines, key=attrgetter("name")
+        )
+        expected_allowed_pipelines = sorted(
+            expected_allowed_pipelines, key=attrgetter("name")
+        )
+        assert len(actual_allowed_pipelines) == len(expected_allowed_pipelines)
         for actual, expected in zip(
             actual_allowed_pipelines, expected_allowed_pipelines
         ):
-            for pipeline_subclass in [
-                BinaryClassificationPipeline,
-                MulticlassClassificationPipeline,
-                RegressionPipeline,
-            ]:
-                if isinstance(expected, pipeline_subclass):
-                    assert isinstance(expected, pipeline_subclass)
-                    break
             assert actual.parameters == expected.parameters
             assert actual.name == expected.name
             assert actual.problem_type == expected.problem_type
@@ -644,33 +669,48 @@ def combination_of_faulty_datetime():
     return dates
 
 
-@pytest.fixture
-def X_y_binary():
+def _read_only(*arrays):
+    for array in arrays:
+        array.setflags(write=False)
+    return arrays
+
+
+@pytest.fixture(scope="session")
+def _X_y_binary():
     X, y = datasets.make_classification(
         n_samples=100, n_features=20, n_informative=2, n_redundant=2, random_state=0
     )
+    return _read_only(X, y)
 
-    return X, y
+
+@pytest.fixture
+def X_y_binary(_X_y_binary):
+    X, y = _X_y_binary
+    return X.copy(), y.copy()
 
 
 @pytest.fixture(scope="session")
-def X_y_binary_cls():
-    X, y = datasets.make_classification(
-        n_samples=100, n_features=20, n_informative=2, n_redundant=2, random_state=0
-    )
+def X_y_binary_cls(_X_y_binary):
+    X, y = _X_y_binary
     return pd.DataFrame(X), pd.Series(y)
 
 
-@pytest.fixture
-def X_y_regression():
+@pytest.fixture(scope="session")
+def _X_y_regression():
     X, y = datasets.make_regression(
         n_samples=100, n_features=20, n_informative=3, random_state=0
     )
-    return X, y
+    return _read_only(X, y)
 
 
 @pytest.fixture
-def X_y_multi():
+def X_y_regression(_X_y_regression):
+    X, y = _X_y_regression
+    return X.copy(), y.copy()
+
+
+@pytest.fixture(scope="session")
+def _X_y_multi():
     X, y = datasets.make_classification(
         n_samples=100,
         n_features=20,
@@ -679,13 +719,24 @@ def X_y_multi():
         n_redundant=2,
         random_state=0,
     )
-    return X, y
+    return _read_only(X, y)
 
 
 @pytest.fixture
-def X_y_categorical_regression():
+def X_y_multi(_X_y_multi):
+    X, y = _X_y_multi
+    return X.copy(), y.copy()
+
+
+@pytest.fixture(scope="session")
+def _tips():
     data_path = os.path.join(os.path.dirname(__file__), "data/tips.csv")
-    flights = pd.read_csv(data_path)
+    return pd.read_csv(data_path)
+
+
+@pytest.fixture
+def X_y_categorical_regression(_tips):
+    flights = _tips.copy()
 
     y = flights["tip"]
     X = flights.drop("tip", axis=1)
@@ -695,10 +746,15 @@ def X_y_categorical_regression():
     return X, y
 
 
-@pytest.fixture
-def X_y_categorical_classification():
+@pytest.fixture(scope="session")
+def _titanic():
     data_path = os.path.join(os.path.dirname(__file__), "data/titanic.csv")
-    titanic = pd.read_csv(data_path)
+    return pd.read_csv(data_path)
+
+
+@pytest.fixture
+def X_y_categorical_classification(_titanic):
+    titanic = _titanic.copy()
 
     y = titanic["Survived"]
     X = titanic.drop(["Survived", "Name"], axis=1)
@@ -757,11 +813,9 @@ def text_df():
 
 @pytest.fixture
 def ts_data():
-    X, y = pd.DataFrame(
-        {"features": range(101, 132), "date": pd.date_range("2020-10-01", "2020-10-31")}
-    ), pd.Series(range(1, 32))
-    y.index = pd.date_range("2020-10-01", "2020-10-31")
-    X.index = pd.date_range("2020-10-01", "2020-10-31")
+    dates = pd.date_range("2020-10-01", "2020-10-31")
+    X = pd.DataFrame({"features": range(101, 132), "date": dates}, index=dates)
+    y = pd.Series(range(1, 32), index=dates.copy())
     return X, y
 
 
@@ -782,18 +836,18 @@ def ts_data_multi(ts_data):
 @pytest.fixture
 def ts_data_seasonal_train():
     sine_ = np.linspace(-np.pi * 5, np.pi * 5, 25)
-    X, y = pd.DataFrame({"features": range(25)}), pd.Series(sine_)
-    y.index = pd.date_range(start="1/1/2018", periods=25)
-    X.index = pd.date_range(start="1/1/2018", periods=25)
+    dates = pd.date_range(start="1/1/2018", periods=25)
+    X = pd.DataFrame({"features": range(25)}, index=dates)
+    y = pd.Series(sine_, index=dates.copy())
     return X, y
 
 
 @pytest.fixture
 def ts_data_seasonal_test():
     sine_ = np.linspace(-np.pi * 5, np.pi * 5, 25)
-    X, y = pd.DataFrame({"features": range(25)}), pd.Series(sine_)
-    y.index = pd.date_range(start="1/26/2018", periods=25)
-    X.index = pd.date_range(start="1/26/2018", periods=25)
+    dates = pd.date_range(start="1/26/2018", periods=25)
+    X = pd.DataFrame({"features": range(25)}, index=dates)
+    y = pd.Series(sine_, index=dates.copy())
     return X, y
 
 
@@ -831,7 +885,7 @@ def dummy_pipeline_hyperparameters_small():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dummy_classifier_estimator_class():
     class MockEstimator(Estimator):
         name = "Mock Classifier"
@@ -935,7 +989,7 @@ def dummy_multiclass_pipeline(dummy_classifier_estimator_class):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dummy_regressor_estimator_class():
     class MockRegressor(Estimator):
         name = "Mock Regressor"
@@ -962,7 +1016,7 @@ def dummy_regression_pipeline(dummy_regressor_estimator_class):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dummy_time_series_regressor_estimator_class():
     class MockTimeSeriesRegressor(Estimator):
         name = "Mock Time Series Regressor"
@@ -1258,46 +1312,47 @@ def nonlinear_regression_pipeline(example_regression_graph):
     )
 
 
-@pytest.fixture
+# Objectives only set attributes in __init__ and scoring never mutates them,
+# so the objective fixtures share one set of instances across the session.
+@pytest.fixture(scope="session")
 def binary_test_objectives():
-    return [
+    return tuple(
         o
         for o in get_core_objectives(ProblemTypes.BINARY)
         if o.name in {"Log Loss Binary", "F1", "AUC"}
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiclass_test_objectives():
-    return [
+    return tuple(
         o
         for o in get_core_objectives(ProblemTypes.MULTICLASS)
         if o.name in {"Log Loss Multiclass", "AUC Micro", "F1 Micro"}
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def regression_test_objectives():
-    return [
+    return tuple(
         o
         for o in get_core_objectives(ProblemTypes.REGRESSION)
         if o.name in {"R2", "Root Mean Squared Error", "MAE"}
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def time_series_core_objectives():
-    return get_core_objectives(ProblemTypes.TIME_SERIES_REGRESSION)
+    return tuple(get_core_objectives(ProblemTypes.TIME_SERIES_REGRESSION))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def time_series_non_core_objectives():
-    non_core_time_series = [
+    return tuple(
         obj_()
         for obj_ in get_non_core_objectives()
         if ProblemTypes.TIME_SERIES_REGRESSION in obj_.problem_types
-    ]
-    return non_core_time_series
+    )
 
 
 @pytest.fixture
@@ -1307,43 +1362,36 @@ def time_series_objectives(
     return time_series_core_objectives + time_series_non_core_objectives
 
 
-@pytest.fixture
+def _stackable_estimators(problem_types):
+    """Estimator classes that support exactly ``problem_types`` and can be stacked."""
+    problem_types = frozenset(problem_types)
+    return tuple(
+        estimator_class
+        for estimator_class in _cached_all_estimators()
+        if frozenset(map(handle_problem_types, estimator_class.supported_problem_types))
+        == problem_types
+        and estimator_class.model_family not in _nonstackable_model_families
+        and estimator_class.model_family is not ModelFamily.ENSEMBLE
+    )
+
+
+@pytest.fixture(scope="session")
 def stackable_classifiers():
-    stackable_classifiers = []
-    for estimator_class in _all_estimators():
-        supported_problem_types = [
-            handle_problem_types(pt) for pt in estimator_class.supported_problem_types
-        ]
-        if (
-            set(supported_problem_types)
-            == {
-                ProblemTypes.BINARY,
-                ProblemTypes.MULTICLASS,
-                ProblemTypes.TIME_SERIES_BINARY,
-                ProblemTypes.TIME_SERIES_MULTICLASS,
-            }
-            and estimator_class.model_family not in _nonstackable_model_families
-            and estimator_class.model_family != ModelFamily.ENSEMBLE
-        ):
-            stackable_classifiers.append(estimator_class)
-    return stackable_classifiers
+    return _stackable_estimators(
+        {
+            ProblemTypes.BINARY,
+            ProblemTypes.MULTICLASS,
+            ProblemTypes.TIME_SERIES_BINARY,
+            ProblemTypes.TIME_SERIES_MULTICLASS,
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def stackable_regressors():
-    stackable_regressors = []
-    for estimator_class in _all_estimators():
-        supported_problem_types = [
-            handle_problem_types(pt) for pt in estimator_class.supported_problem_types
-        ]
-        if (
-            set(supported_problem_types)
-            == {ProblemTypes.REGRESSION, ProblemTypes.TIME_SERIES_REGRESSION}
-            and estimator_class.model_family not in _nonstackable_model_families
-            and estimator_class.model_family != ModelFamily.ENSEMBLE
-        ):
-            stackable_regressors.append(estimator_class)
-    return stackable_regressors
+    return _stackable_estimators(
+        {ProblemTypes.REGRESSION, ProblemTypes.TIME_SERIES_REGRESSION}
+    )
 
 
 @pytest.fixture
@@ -1371,7 +1419,7 @@ def logit_estimator():
     return est_class
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def helper_functions():
     class Helpers:
         @staticmethod
@@ -1385,27 +1433,44 @@ def helper_functions():
     return Helpers
 
 
+def _to_numpy(data):
+    return data
+
+
+def _to_list(data):
+    if isinstance(data, pd.DataFrame):
+        data = data.to_numpy()
+    return data.tolist()
+
+
+def _to_pandas(data):
+    if len(data.shape) == 1:
+        return pd.Series(data)
+    return pd.DataFrame(data)
+
+
+def _to_woodwork(data):
+    data = _to_pandas(data)
+    if len(data.shape) == 1:
+        return ww.init_series(data)
+    data.ww.init()
+    return data
+
+
+_DATA_TYPE_CONVERTERS = {
+    "li": _to_list,
+    "np": _to_numpy,
+    "pd": _to_pandas,
+    "ww": _to_woodwork,
+}
+
+
 @pytest.fixture
 def make_data_type():
     """Helper function to convert numpy or pandas input to the appropriate type for tests."""
 
     def _make_data_type(data_type, data):
-        if data_type == "li":
-            if isinstance(data, pd.DataFrame):
-                data = data.to_numpy()
-            data = data.tolist()
-            return data
-        if data_type != "np":
-            if len(data.shape) == 1:
-                data = pd.Series(data)
-            else:
-                data = pd.DataFrame(data)
-        if data_type == "ww":
-            if len(data.shape) == 1:
-                data = ww.init_series(data)
-            else:
-                data.ww.init()
-        return data
+        return _DATA_TYPE_CONVERTERS[data_type](data)
 
     return _make_data_type
 
@@ -1424,51 +1489,87 @@ def load_fraud_local(n_rows=None):
     return X, y
 
 
-@pytest.fixture
-def fraud_local():
+def _ww_copy(X, y):
+    """Copy a cached woodwork-initialized dataset so tests can mutate it freely."""
+    return X.ww.copy(), y.ww.copy()
+
+
+def _ensure_ww_types(X, logical_types):
+    """Set only the logical types that woodwork did not already infer."""
+    logical_types = {
+        col: logical_type
+        for col, logical_type in logical_types.items()
+        if type(X.ww.logical_types[col])
+        is not ww.type_system.str_to_logical_type(logical_type)
+    }
+    if logical_types:
+        X.ww.set_types(logical_types=logical_types)
+
+
+@pytest.fixture(scope="session")
+def _fraud_local():
     X, y = load_fraud_local()
-    X.ww.set_types(logical_types={"provider": "Categorical", "region": "Categorical"})
+    _ensure_ww_types(X, {"provider": "Categorical", "region": "Categorical"})
     return X, y
 
 
 @pytest.fixture
-def fraud_100():
+def fraud_local(_fraud_local):
+    return _ww_copy(*_fraud_local)
+
+
+@pytest.fixture(scope="session")
+def _fraud_100():
     X, y = load_fraud_local(n_rows=100)
-    X.ww.set_types(
-        logical_types={
+    _ensure_ww_types(
+        X,
+        {
             "provider": "Categorical",
             "region": "Categorical",
             "currency": "categorical",
             "expiration_date": "categorical",
-        }
+        },
     )
     return X, y
 
 
 @pytest.fixture
-def breast_cancer_local():
+def fraud_100(_fraud_100):
+    return _ww_copy(*_fraud_100)
+
+
+@pytest.fixture(scope="session")
+def _breast_cancer_local():
     data = datasets.load_breast_cancer()
     X = pd.DataFrame(data.data, columns=data.feature_names)
-    y = pd.Series(data.target)
-    y = y.map(lambda x: data["target_names"][x])
+    y = pd.Series(data.target_names[data.target])
     X.ww.init()
     y = ww.init_series(y)
     return X, y
 
 
 @pytest.fixture
-def wine_local():
+def breast_cancer_local(_breast_cancer_local):
+    return _ww_copy(*_breast_cancer_local)
+
+
+@pytest.fixture(scope="session")
+def _wine_local():
     data = datasets.load_wine()
     X = pd.DataFrame(data.data, columns=data.feature_names)
-    y = pd.Series(data.target)
-    y = y.map(lambda x: data["target_names"][x])
+    y = pd.Series(data.target_names[data.target])
     X.ww.init()
     y = ww.init_series(y)
     return X, y
 
 
 @pytest.fixture
-def diabetes_local():
+def wine_local(_wine_local):
+    return _ww_copy(*_wine_local)
+
+
+@pytest.fixture(scope="session")
+def _diabetes_local():
     data = datasets.load_diabetes()
     X = pd.DataFrame(data.data, columns=data.feature_names)
     y = pd.Series(data.target)
@@ -1478,7 +1579,12 @@ def diabetes_local():
 
 
 @pytest.fixture
-def churn_local():
+def diabetes_local(_diabetes_local):
+    return _ww_copy(*_diabetes_local)
+
+
+@pytest.fixture(scope="session")
+def _churn_local():
     currdir_path = os.path.dirname(os.path.abspath(__file__))
     data_folder_path = os.path.join(currdir_path, "data")
     churn_data_path = os.path.join(data_folder_path, "churn.csv")
@@ -1489,6 +1595,18 @@ def churn_local():
     )
 
 
+@pytest.fixture
+def churn_local(_churn_local):
+    return _ww_copy(*_churn_local)
+
+
+_IMBALANCED_COL_NAMES = tuple(f"col_{i}" for i in range(100))
+_IMBALANCED_BINARY_TARGETS = np.repeat(np.array([0, 1], dtype=np.int64), [3500, 700])
+_IMBALANCED_MULTICLASS_TARGETS = np.repeat(
+    np.array([0, 1, 2], dtype=np.int64), [3000, 600, 600]
+)
+
+
 @pytest.fixture
 def mock_imbalanced_data_X_y():
     """Helper function to return an imbalanced binary or multiclass dataset"""
@@ -1504,13 +1622,13 @@ def mock_imbalanced_data_X_y():
             size (str): Either 'large' or 'small'. 'large' returns a dataset of size 21,000, while 'small' returns a size of 4200
         """
         multiplier = 5 if size == "large" else 1
-        col_names = [f"col_{i}" for i in range(100)]
+        col_names = _IMBALANCED_COL_NAMES
         # generate X to be all int values
-        X_dict = {
-            col_name: [i % (j + 1) for i in range(1, 100)]
-            for j, col_name in enumerate(col_names)
-        }
-        X = pd.DataFrame(X_dict)
+        X = pd.DataFrame(
+            np.arange(1, 100, dtype=np.int64)[:, None]
+            % np.arange(1, len(col_names) + 1, dtype=np.int64),
+            columns=col_names,
+        )
         if categorical_columns == "all":
             X.ww.init(logical_types={col_name: "Categorical" for col_name in col_names})
         elif categorical_columns == "some":
@@ -1523,16 +1641,26 @@ def mock_imbalanced_data_X_y():
         else:
             X.ww.init()
         if problem_type == "binary":
-            targets = [0] * 3500 + [1] * 700
+            targets = _IMBALANCED_BINARY_TARGETS
         else:
-            targets = [0] * 3000 + [1] * 600 + [2] * 600
-        targets *= multiplier
+            targets = _IMBALANCED_MULTICLASS_TARGETS
+        targets = np.tile(targets, multiplier)
         y = ww.init_series(pd.Series(targets))
         return X, y
 
     return _imbalanced_data_X_y
 
 
+_PIPELINE_CLASS_MAP = {
+    ProblemTypes.REGRESSION: "evalml.pipelines.RegressionPipeline",
+    ProblemTypes.BINARY: "evalml.pipelines.BinaryClassificationPipeline",
+    ProblemTypes.MULTICLASS: "evalml.pipelines.MulticlassClassificationPipeline",
+    ProblemTypes.TIME_SERIES_REGRESSION: "evalml.pipelines.TimeSeriesRegressionPipeline",
+    ProblemTypes.TIME_SERIES_MULTICLASS: "evalml.pipelines.TimeSeriesMulticlassClassificationPipeline",
+    ProblemTypes.TIME_SERIES_BINARY: "evalml.pipelines.TimeSeriesBinaryClassificationPipeline",
+}
+
+
 class _AutoMLTestEnv:
     """A test environment that makes it easy to test automl behavior with patched pipeline computations.
 
@@ -1587,14 +1715,7 @@ class _AutoMLTestEnv:
 
     @property
     def _pipeline_class(self):
-        return {
-            ProblemTypes.REGRESSION: "evalml.pipelines.RegressionPipeline",
-            ProblemTypes.BINARY: "evalml.pipelines.BinaryClassificationPipeline",
-            ProblemTypes.MULTICLASS: "evalml.pipelines.MulticlassClassificationPipeline",
-            ProblemTypes.TIME_SERIES_REGRESSION: "evalml.pipelines.TimeSeriesRegressionPipeline",
-            ProblemTypes.TIME_SERIES_MULTICLASS: "evalml.pipelines.TimeSeriesMulticlassClassificationPipeline",
-            ProblemTypes.TIME_SERIES_BINARY: "evalml.pipelines.TimeSeriesBinaryClassificationPipeline",
-        }[self.problem_type]
+        return _PIPELINE_CLASS_MAP[self.problem_type]
 
     def _patch_method(self, method, side_effect, return_value, pipeline_class_str=None):
         kwargs = {}
@@ -1678,15 +1799,22 @@ class _AutoMLTestEnv:
             predict_proba_return_value: Passed as the return_value argument of the pipeline.predict_proba patch.
             optimize_threshold_return_value: Passed as the return value of BinaryClassificationObjective.optimize_threshold patch.
         """
-        mock_fit = self._patch_method(
-            "fit", side_effect=mock_fit_side_effect, return_value=mock_fit_return_value
-        )
-        mock_score = self._patch_method(
-            "score", side_effect=mock_score_side_effect, return_value=score_return_value
-        )
-        mock_get_names = patch(
-            "evalml.pipelines.components.FeatureSelector.get_names", return_value=[]
-        )
+        patches = {
+            "fit": self._patch_method(
+                "fit",
+                side_effect=mock_fit_side_effect,
+                return_value=mock_fit_return_value,
+            ),
+            "score": self._patch_method(
+                "score",
+                side_effect=mock_score_side_effect,
+                return_value=score_return_value,
+            ),
+            "get_names": patch(
+                "evalml.pipelines.components.FeatureSelector.get_names",
+                return_value=[],
+            ),
+        }
 
         # For simplicity, we will always mock predict_proba and _encode_targets even if the problem is not a
         # classification problem. For regression problems, we'll mock BinaryClassificationPipeline but it doesn't
@@ -1695,71 +1823,47 @@ class _AutoMLTestEnv:
         if is_regression(self.problem_type):
             pipeline_to_mock = "evalml.pipelines.BinaryClassificationPipeline"
 
-        mock_encode_targets = self._patch_method(
+        patches["encode_targets"] = self._patch_method(
             "_encode_targets",
             side_effect=lambda y: y,
             return_value=None,
             pipeline_class_str=pipeline_to_mock,
         )
-        mock_predict_proba = self._patch_method(
+        patches["predict_proba"] = self._patch_method(
             "predict_proba",
             side_effect=None,
             return_value=predict_proba_return_value,
             pipeline_class_str=pipeline_to_mock,
         )
-        if handle_problem_types(self.problem_type) in [
+        if self.problem_type in [
             ProblemTypes.TIME_SERIES_BINARY,
             ProblemTypes.TIME_SERIES_MULTICLASS,
         ]:
-            mock_predict_proba_in_sample = self._patch_method(
+            patches["predict_proba_in_sample"] = self._patch_method(
                 "predict_proba_in_sample",
                 side_effect=None,
                 return_value=predict_proba_in_sample_return_value,
                 pipeline_class_str=pipeline_to_mock,
             )
-        else:
-            mock_predict_proba_in_sample = None
-
-        mock_optimize = patch(
+        patches["tell"] = patch("evalml.tuners.skopt_tuner.Optimizer.tell")
+        patches["optimize_threshold"] = patch(
             "evalml.objectives.BinaryClassificationObjective.optimize_threshold",
             return_value=optimize_threshold_return_value,
         )
 
-        mock_tell = patch("evalml.tuners.skopt_tuner.Optimizer.tell")
-
         # Reset the mocks from a previous computation so that ValueError can be properly raised if
         # user tries to access mocks before leaving the context
         self._reset_mocks()
 
-        # Unfortunately, in order to set the MagicMock instances as class attributes we need to use the
-        # `with ... ` syntax.
-        sleep_time = PropertyMock(return_value=0.00000001)
-        mock_sleep = patch(
-            "evalml.automl.AutoMLSearch._sleep_time", new_callable=sleep_time
-        )
-        if mock_predict_proba_in_sample is None:
-            with mock_sleep, mock_fit as fit, mock_score as score, mock_get_names as get_names, mock_encode_targets as encode, mock_predict_proba as proba, mock_tell as tell, mock_optimize as optimize:
-                # Can think of `yield` as blocking this method until the computation finishes running
-                yield
-                self._mock_fit = fit
-                self._mock_tell = tell
-                self._mock_score = score
-                self._mock_get_names = get_names
-                self._mock_encode_targets = encode
-                self._mock_predict_proba = proba
-                self._mock_optimize_threshold = optimize
-        else:
-            with mock_sleep, mock_fit as fit, mock_score as score, mock_get_names as get_names, mock_encode_targets as encode, mock_predict_proba as proba, mock_predict_proba_in_sample as proba_in_sample, mock_tell as tell, mock_optimize as optimize:
-                # Can think of `yield` as blocking this method until the computation finishes running
-                yield
-                self._mock_fit = fit
-                self._mock_tell = tell
-                self._mock_score = score
-                self._mock_get_names = get_names
-                self._mock_encode_targets = encode
-                self._mock_predict_proba = proba
-                self._mock_predict_proba_in_sample = proba_in_sample
-                self._mock_optimize_threshold = optimize
+        # A plain class attribute shadows the property, so no mock has to be built.
+        mock_sleep = patch("evalml.automl.AutoMLSearch._sleep_time", new=0.00000001)
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(mock_sleep)
+            mocks = {name: stack.enter_context(p) for name, p in patches.items()}
+            # Can think of `yield` as blocking this method until the computation finishes running
+            yield
+            for name, mock in mocks.items():
+                setattr(self, f"_mock_{name}", mock)
 
 
 @pytest.fixture
@@ -1769,13 +1873,12 @@ def AutoMLTestEnv():
 
 @pytest.fixture
 def tmpdir(tmp_path):
-    dir = py.path.local(tmp_path)
-    yield dir
-    dir.remove(ignore_errors=True)
+    yield tmp_path
+    shutil.rmtree(tmp_path, ignore_errors=True)
 
 
-@pytest.fixture
-def df_with_url_and_email():
+@pytest.fixture(scope="session")
+def _df_with_url_and_email():
     X = pd.DataFrame(
         {
             "categorical": ["a", "b", "b", "a", "c"],
@@ -1813,22 +1916,31 @@ def df_with_url_and_email():
     return X
 
 
-def CustomClassificationObjectiveRanges(ranges):
-    class CustomClassificationObjectiveRanges(BinaryClassificationObjective):
-        """Accuracy score for binary and multiclass classification."""
+@pytest.fixture
+def df_with_url_and_email(_df_with_url_and_email):
+    return _df_with_url_and_email.ww.copy()
+
 
-        name = "Classification Accuracy"
-        greater_is_better = True
-        score_needs_proba = False
-        perfect_score = 1.0
-        is_bounded_like_percentage = False
-        expected_range = ranges
-        problem_types = [ProblemTypes.BINARY, ProblemTypes.MULTICLASS]
+class _CustomClassificationObjectiveRanges(BinaryClassificationObjective):
+    """Accuracy score for binary and multiclass classification."""
 
-        def objective_function(self, y_true, y_predicted, X=None):
-            """Not implementing since mocked in our tests."""
+    name = "Classification Accuracy"
+    greater_is_better = True
+    score_needs_proba = False
+    perfect_score = 1.0
+    is_bounded_like_percentage = False
+    expected_range = None
+    problem_types = [ProblemTypes.BINARY, ProblemTypes.MULTICLASS]
 
-    return CustomClassificationObjectiveRanges()
+    def __init__(self, ranges):
+        self.expected_range = ranges
+
+    def objective_function(self, y_true, y_predicted, X=None):
+        """Not implementing since mocked in our tests."""
+
+
+def CustomClassificationObjectiveRanges(ranges):
+    return _CustomClassificationObjectiveRanges(ranges)
 
 
 def load_daily_temp_local(n_rows=None):
@@ -1841,38 +1953,27 @@ def load_daily_temp_local(n_rows=None):
         target="Temp",
         n_rows=n_rows,
     )
-    missing_date_1 = pd.DataFrame([pd.to_datetime("1984-12-31")], columns=["Date"])
-    missing_date_2 = pd.DataFrame([pd.to_datetime("1988-12-31")], columns=["Date"])
-    missing_y_1 = pd.Series([14.5], name="Temp")
-    missing_y_2 = pd.Series([14.5], name="Temp")
-
-    X = pd.concat(
-        [
-            X.iloc[:1460],
-            missing_date_1,
-            X.iloc[1460:2920],
-            missing_date_2,
-            X.iloc[2920:],
-        ]
-    ).reset_index(drop=True)
-    y = pd.concat(
-        [
-            y.iloc[:1460],
-            missing_y_1,
-            y.iloc[1460:2920],
-            missing_y_2,
-            y.iloc[2920:],
-        ]
-    ).reset_index(drop=True)
+    # The source data skips two days; fill them in so the series has a regular frequency.
+    missing_positions = np.minimum([1460, 2920], len(y))
+    missing_dates = np.array(["1984-12-31", "1988-12-31"], dtype="datetime64[ns]")
+    X = pd.DataFrame(
+        {"Date": np.insert(X["Date"].to_numpy(), missing_positions, missing_dates)}
+    )
+    y = pd.Series(np.insert(y.to_numpy(), missing_positions, 14.5), name="Temp")
     return X, y
 
 
-@pytest.fixture
-def daily_temp_local():
+@pytest.fixture(scope="session")
+def _daily_temp_local():
     X, y = load_daily_temp_local()
     return infer_feature_types(X), infer_feature_types(y)
 
 
+@pytest.fixture
+def daily_temp_local(_daily_temp_local):
+    return _ww_copy(*_daily_temp_local)
+
+
 @pytest.fixture
 def dummy_data_check_name():
     return "dummy_data_check_name"
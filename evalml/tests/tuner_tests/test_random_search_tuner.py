@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
@@ -112,3 +114,22 @@ def test_random_search_tuner_invalid_space():
         RandomSearchTuner(
             {"Mock Classifier": {"param a": (0, 0)}}, random_seed=random_seed
         )
+
+
+def test_random_search_tuner_propose_batch(dummy_pipeline_hyperparameters):
+    tuner = RandomSearchTuner(dummy_pipeline_hyperparameters, random_seed=random_seed)
+    expected_tuner = RandomSearchTuner(
+        dummy_pipeline_hyperparameters, random_seed=random_seed
+    )
+    generated_parameters = tuner.propose_batch(3)
+    assert generated_parameters == [expected_tuner.propose() for _ in range(3)]
+
+
+def test_random_search_tuner_add_batch(dummy_pipeline_hyperparameters):
+    tuner = RandomSearchTuner(dummy_pipeline_hyperparameters, random_seed=random_seed)
+    parameters = [tuner.propose(), tuner.propose()]
+    with patch.object(RandomSearchTuner, "add") as mock_add:
+        tuner.add_batch(parameters, [0.1, 0.2])
+    assert mock_add.call_args_list == [((parameters[0], 0.1),), ((parameters[1], 0.2),)]
+    with pytest.raises(ValueError, match="must have the same length, got 2 and 1"):
+        tuner.add_batch(parameters, [0.1])
@@ -277,3 +277,170 @@ def test_skopt_tuner_propose():
             "param c": "option c",
         }
     }
+
+
+def test_skopt_tuner_propose_batch():
+    pipeline_hyperparameter_ranges = {
+        "Mock Classifier": {
+            "param a": Integer(0, 10),
+            "param b": Real(0, 10),
+            "param c": ["option a", "option b", "option c"],
+        }
+    }
+    tuner = SKOptTuner(pipeline_hyperparameter_ranges, random_seed=random_seed)
+    for i in range(10):
+        tuner.add(tuner.propose(), i)
+
+    parameters = tuner.propose_batch(3)
+    assert len(parameters) == 3
+    flat_parameters = set()
+    for proposal in parameters:
+        assert proposal.keys() == {"Mock Classifier"}
+        assert proposal["Mock Classifier"]["param a"] in Integer(0, 10)
+        assert proposal["Mock Classifier"]["param b"] in Real(0, 10)
+        assert proposal["Mock Classifier"]["param c"] in [
+            "option a",
+            "option b",
+            "option c",
+        ]
+        flat_parameters.add(tuple(proposal["Mock Classifier"].values()))
+    assert len(flat_parameters) == 3
+
+
+def test_skopt_tuner_propose_batch_empty_search_space():
+    tuner = SKOptTuner({"Mock Classifier": {}}, random_seed=random_seed)
+    assert tuner.propose_batch(2) == [{"Mock Classifier": {}}, {"Mock Classifier": {}}]
+
+
+def test_skopt_tuner_propose_empty_search_space_returns_new_dicts():
+    tuner = SKOptTuner({"Mock Classifier": {}}, random_seed=random_seed)
+    proposal = tuner.propose()
+    proposal["Mock Classifier"]["param a"] = 1
+    assert tuner.propose() == {"Mock Classifier": {}}
+
+
+def test_skopt_tuner_add_batch_matches_add():
+    pipeline_hyperparameter_ranges = {
+        "Mock Classifier": {
+            "param a": Integer(0, 10),
+            "param b": Real(0, 10),
+            "param c": ["option a", "option b", "option c"],
+        }
+    }
+    tuner = SKOptTuner(pipeline_hyperparameter_ranges, random_seed=random_seed)
+    batch_tuner = SKOptTuner(pipeline_hyperparameter_ranges, random_seed=random_seed)
+    parameters = tuner.propose_batch(5)
+    scores = [0.1, np.nan, 0.3, None, 0.5]
+    for proposal, score in zip(parameters, scores):
+        tuner.add(proposal, score)
+    batch_tuner.add_batch(parameters, scores)
+    assert batch_tuner.opt.Xi == tuner.opt.Xi
+    assert batch_tuner.opt.yi == tuner.opt.yi == [0.1, 0.3, 0.5]
+
+
+@patch("evalml.tuners.skopt_tuner.Optimizer.tell")
+def test_skopt_tuner_add_batch_tells_once(mock_optimizer_tell):
+    tuner = SKOptTuner(
+        {"Mock Classifier": {"param a": Integer(0, 10)}}, random_seed=random_seed
+    )
+    tuner.add_batch(
+        [
+            {"Mock Classifier": {"param a": 1}},
+            {"Mock Classifier": {"param a": 2}},
+            {"Mock Classifier": {"param a": 3}},
+        ],
+        [0.1, np.nan, 0.3],
+    )
+    mock_optimizer_tell.assert_called_once_with([[1], [3]], [0.1, 0.3])
+
+    mock_optimizer_tell.reset_mock()
+    tuner.add_batch([{"Mock Classifier": {"param a": 1}}], [np.nan])
+    tuner.add_batch([], [])
+    mock_optimizer_tell.assert_not_called()
+
+
+def test_skopt_tuner_add_batch_invalid():
+    tuner = SKOptTuner(
+        {
+            "Mock Classifier": {
+                "param a": Integer(0, 10),
+                "param b": Real(0, 10),
+            }
+        },
+        random_seed=random_seed,
+    )
+    with pytest.raises(ValueError, match="must have the same length, got 1 and 2"):
+        tuner.add_batch([{"Mock Classifier": {"param a": 0, "param b": 0.0}}], [1, 2])
+    with pytest.raises(
+        TypeError,
+        match='Pipeline parameters missing required field "param b" for component "Mock Classifier"',
+    ):
+        tuner.add_batch([{"Mock Classifier": {"param a": 0}}], [0.5])
+    with pytest.raises(
+        ParameterError, match="Invalid parameters specified to SKOptTuner.add"
+    ):
+        tuner.add_batch(
+            [
+                {"Mock Classifier": {"param a": 0, "param b": 0.0}},
+                {"Mock Classifier": {"param a": None, "param b": 0.0}},
+            ],
+            [0.5, 0.5],
+        )
+    assert tuner.opt.Xi == []
+
+
+@pytest.mark.parametrize(
+    "base_estimator,acq_optimizer",
+    [("ET", "sampling"), ("GBRT", "sampling"), ("RF", "sampling"), ("GP", "lbfgs")],
+)
+def test_skopt_tuner_base_estimator(base_estimator, acq_optimizer):
+    pipeline_hyperparameter_ranges = {
+        "Mock Classifier": {
+            "param a": Real(0, 1),
+            "param b": Real(0, 10),
+        }
+    }
+    tuner = SKOptTuner(
+        pipeline_hyperparameter_ranges,
+        random_seed=random_seed,
+        base_estimator=base_estimator,
+    )
+    assert tuner.opt.acq_optimizer == acq_optimizer
+    for i in range(12):
+        proposal = tuner.propose()
+        assert proposal["Mock Classifier"]["param a"] in Real(0, 1)
+        assert proposal["Mock Classifier"]["param b"] in Real(0, 10)
+        tuner.add(proposal, i)
+    assert len(tuner.opt.models) > 0
+
+
+def test_skopt_tuner_optimizer_settings():
+    pipeline_hyperparameter_ranges = {
+        "Mock Classifier": {
+            "param a": Integer(0, 10),
+            "param b": Real(0, 10),
+            "param c": ["option a", "option b", "option c"],
+        }
+    }
+    tuner = SKOptTuner(pipeline_hyperparameter_ranges, random_seed=random_seed)
+    assert tuner.opt.n_points == 10000
+    assert tuner.opt.base_estimator_.n_jobs == 1
+
+    tuner = SKOptTuner(
+        pipeline_hyperparameter_ranges,
+        random_seed=random_seed,
+        n_jobs=2,
+        acq_optimizer_kwargs={"n_points": 1000},
+    )
+    assert tuner.opt.n_points == 1000
+    assert tuner.opt.base_estimator_.n_jobs == 2
+    for i in range(12):
+        proposal = tuner.propose()
+        assert proposal["Mock Classifier"]["param a"] in Integer(0, 10)
+        assert proposal["Mock Classifier"]["param b"] in Real(0, 10)
+        assert proposal["Mock Classifier"]["param c"] in [
+            "option a",
+            "option b",
+            "option c",
+        ]
+        tuner.add(proposal, i)
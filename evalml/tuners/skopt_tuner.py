@@ -1,22 +1,31 @@
 """Bayesian Optimizer."""
 import logging
+import math
 import warnings
 
-import pandas as pd
+import numpy as np
 from skopt import Optimizer
 
-from .tuner import Tuner
+from .tuner import Tuner, _validate_batch_lengths
 from .tuner_exceptions import ParameterError
 
 logger = logging.getLogger(__name__)
 
 
+def _is_missing_score(score):
+    return score is None or math.isnan(score)
+
+
 class SKOptTuner(Tuner):
     """Bayesian Optimizer.
 
     Args:
         pipeline_hyperparameter_ranges (dict): A set of hyperparameter ranges corresponding to a pipeline's parameters.
         random_seed (int): The seed for the random number generator. Defaults to 0.
+        base_estimator (str or sklearn regressor): The surrogate model fit to the observed scores. One of "ET", "GBRT", "RF", "GP", or a regressor instance.
+            The acquisition function is optimized with L-BFGS for models that expose gradients, such as "GP", and by random sampling otherwise. Defaults to "ET".
+        n_jobs (int): The number of jobs used to fit the surrogate model when base_estimator is given as a string. Defaults to 1.
+        acq_optimizer_kwargs (dict): Passed through to skopt's Optimizer, e.g. {"n_points": 1000} to score fewer random candidates per proposal when sampling. Defaults to None.
 
     Examples:
         >>> tuner = SKOptTuner({'My Component': {'param a': [0.0, 10.0], 'param b': ['a', 'b', 'c']}})
@@ -38,12 +47,21 @@ class SKOptTuner(Tuner):
         {'My Component': {'param a': 3.3739616041726843, 'param b': 'b'}}
     """
 
-    def __init__(self, pipeline_hyperparameter_ranges, random_seed=0):
+    def __init__(
+        self,
+        pipeline_hyperparameter_ranges,
+        random_seed=0,
+        base_estimator="ET",
+        n_jobs=1,
+        acq_optimizer_kwargs=None,
+    ):
         super().__init__(pipeline_hyperparameter_ranges, random_seed=random_seed)
         self.opt = Optimizer(
             self._search_space_ranges,
-            "ET",
-            acq_optimizer="sampling",
+            base_estimator,
+            n_jobs=n_jobs,
+            acq_optimizer="auto",
+            acq_optimizer_kwargs=acq_optimizer_kwargs,
             random_state=random_seed,
         )
 
@@ -62,16 +80,57 @@ class SKOptTuner(Tuner):
             ParameterError: If skopt receives invalid parameters.
         """
         # skip adding nan scores
-        if pd.isnull(score):
+        if _is_missing_score(score):
             return
         flat_parameter_values = self._convert_to_flat_parameters(pipeline_parameters)
+        self._tell(flat_parameter_values, score, pipeline_parameters)
+
+    def add_batch(self, pipeline_parameters_list, scores):
+        """Add scores for several samples at once.
+
+        The surrogate model is refit once for the whole batch rather than once per sample, so this is cheaper than calling add repeatedly.
+
+        Args:
+            pipeline_parameters_list (list(dict)): The parameters used to evaluate each pipeline.
+            scores (list(float)): The score obtained by evaluating each pipeline, in the same order as pipeline_parameters_list.
+
+        Returns:
+            None
+
+        Raises:
+            Exception: If skopt tuner errors.
+            ParameterError: If skopt receives invalid parameters.
+            ValueError: If pipeline_parameters_list and scores have different lengths.
+        """
+        _validate_batch_lengths(pipeline_parameters_list, scores)
+        # skip adding nan scores; None becomes NaN in a float array
+        scores = np.asarray(scores, dtype=np.float64)
+        keep = ~np.isnan(scores)
+        if not keep.any():
+            return
+        pipeline_parameters_list = [
+            pipeline_parameters
+            for pipeline_parameters, kept in zip(pipeline_parameters_list, keep)
+            if kept
+        ]
+        flat_parameter_values = [
+            self._convert_to_flat_parameters(pipeline_parameters)
+            for pipeline_parameters in pipeline_parameters_list
+        ]
+        self._tell(
+            flat_parameter_values, scores[keep].tolist(), pipeline_parameters_list
+        )
+
+    def _tell(self, flat_parameter_values, score, pipeline_parameters):
         try:
             self.opt.tell(flat_parameter_values, score)
         except Exception as e:
             logger.debug(
-                "SKOpt tuner received error during add. Score: {}\nParameters: {}\nFlat parameter values: {}\nError: {}".format(
-                    pipeline_parameters, score, flat_parameter_values, e
-                )
+                "SKOpt tuner received error during add. Score: %s\nParameters: %s\nFlat parameter values: %s\nError: %s",
+                score,
+                pipeline_parameters,
+                flat_parameter_values,
+                e,
             )
             if str(e) == "'<=' not supported between instances of 'int' and 'NoneType'":
                 msg = "Invalid parameters specified to SKOptTuner.add: parameters {} error {}".format(
@@ -87,9 +146,31 @@ class SKOptTuner(Tuner):
         Returns:
             dict: Proposed pipeline parameters.
         """
+        if not len(self._search_space_ranges):
+            return self._convert_to_pipeline_parameters({})
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            if not len(self._search_space_ranges):
-                return self._convert_to_pipeline_parameters({})
             flat_parameters = self.opt.ask()
             return self._convert_to_pipeline_parameters(flat_parameters)
+
+    def propose_batch(self, n):
+        """Returns n suggested sets of parameters to train and score pipelines with, based off the search space dimensions and prior samples.
+
+        Points are chosen jointly using skopt's constant liar strategy, so the proposals are distinct even once the optimizer has left its random initialization phase.
+        This refits the surrogate model once per proposed point, so it is more expensive than calling propose repeatedly.
+
+        Args:
+            n (int): The number of parameter sets to propose.
+
+        Returns:
+            list(dict): Proposed pipeline parameters.
+        """
+        if not len(self._search_space_ranges):
+            return [self._convert_to_pipeline_parameters({}) for _ in range(n)]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            flat_parameters_list = self.opt.ask(n_points=n, strategy="cl_min")
+            return [
+                self._convert_to_pipeline_parameters(flat_parameters)
+                for flat_parameters in flat_parameters_list
+            ]
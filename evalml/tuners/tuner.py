@@ -16,8 +16,7 @@ class Tuner(ABC):
 
     def __init__(self, pipeline_hyperparameter_ranges, random_seed=0):
         self._pipeline_hyperparameter_ranges = pipeline_hyperparameter_ranges
-        self._parameter_names_map = dict()
-        self._search_space_names = []
+        self._search_space_keys = []
         self._search_space_ranges = []
         self.random_seed = random_seed
         if not isinstance(pipeline_hyperparameter_ranges, dict):
@@ -46,21 +45,13 @@ class Tuner(ABC):
                     parameter_range, (Real, Integer, Categorical, list, tuple)
                 ):
                     continue
-                flat_parameter_name = "{}: {}".format(component_name, parameter_name)
-                self._parameter_names_map[flat_parameter_name] = (
-                    component_name,
-                    parameter_name,
-                )
-                self._search_space_names.append(flat_parameter_name)
+                self._search_space_keys.append((component_name, parameter_name))
                 self._search_space_ranges.append(parameter_range)
 
     def _convert_to_flat_parameters(self, pipeline_parameters):
         """Convert from pipeline parameters to a flat list of values."""
         flat_parameter_values = []
-        for flat_parameter_name in self._search_space_names:
-            component_name, parameter_name = self._parameter_names_map[
-                flat_parameter_name
-            ]
+        for component_name, parameter_name in self._search_space_keys:
             if (
                 component_name not in pipeline_parameters
                 or parameter_name not in pipeline_parameters[component_name]
@@ -80,12 +71,9 @@ class Tuner(ABC):
         pipeline_parameters = {
             component_name: dict() for component_name in self._component_names
         }
-        for flat_parameter_name, parameter_value in zip(
-            self._search_space_names, flat_parameters
+        for (component_name, parameter_name), parameter_value in zip(
+            self._search_space_keys, flat_parameters
         ):
-            component_name, parameter_name = self._parameter_names_map[
-                flat_parameter_name
-            ]
             pipeline_parameters[component_name][parameter_name] = parameter_value
         return pipeline_parameters
 
@@ -131,6 +119,23 @@ class Tuner(ABC):
             None
         """
 
+    def add_batch(self, pipeline_parameters_list, scores):
+        """Register several sets of hyperparameters with the scores obtained from training pipelines with those hyperparameters.
+
+        Args:
+            pipeline_parameters_list (list(dict)): The parameters used to evaluate each pipeline.
+            scores (list(float)): The score obtained by evaluating each pipeline, in the same order as pipeline_parameters_list.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If pipeline_parameters_list and scores have different lengths.
+        """
+        _validate_batch_lengths(pipeline_parameters_list, scores)
+        for pipeline_parameters, score in zip(pipeline_parameters_list, scores):
+            self.add(pipeline_parameters, score)
+
     @abstractmethod
     def propose(self):
         """Returns a suggested set of parameters to train and score a pipeline with, based off the search space dimensions and prior samples.
@@ -139,6 +144,17 @@ class Tuner(ABC):
             dict: Proposed pipeline parameters
         """
 
+    def propose_batch(self, n):
+        """Returns n suggested sets of parameters to train and score pipelines with, based off the search space dimensions and prior samples.
+
+        Args:
+            n (int): The number of parameter sets to propose.
+
+        Returns:
+            list(dict): Proposed pipeline parameters.
+        """
+        return [self.propose() for _ in range(n)]
+
     def is_search_space_exhausted(self):
         """Optional. If possible search space for tuner is finite, this method indicates whether or not all possible parameters have been scored.
 
@@ -146,3 +162,12 @@ class Tuner(ABC):
             bool: Returns true if all possible parameters in a search space has been scored.
         """
         return False
+
+
+def _validate_batch_lengths(pipeline_parameters_list, scores):
+    if len(pipeline_parameters_list) != len(scores):
+        raise ValueError(
+            "pipeline_parameters_list and scores must have the same length, got {} and {}".format(
+                len(pipeline_parameters_list), len(scores)
+            )
+        )